@@ -17,6 +17,8 @@ class DimDoctorPreprocessor:
     -------
     generate_dim_doctor(list_of_df: List[pd.DataFrame]) -> pd.DataFrame
         Combines, deduplicates, and enriches doctor data with IDs and assigned hubs.
+    anonymize_doctor_names(dim_doctor: pd.DataFrame) -> pd.DataFrame
+        Replaces doctor names with labels derived from DoctorID.
     """
 
     REQUIRED_COLUMNS = {'Doctor', 'Specialization'}
@@ -52,12 +54,12 @@ class DimDoctorPreprocessor:
             if missing:
                 raise ValueError(f"DataFrame at index {i} is missing columns: {missing}")
 
-        # Concatenate and drop duplicates
+        # Extract distinct doctors per source, then merge only the small key sets
         required_cols = list(DimDoctorPreprocessor.REQUIRED_COLUMNS)
         dim_doctor = pd.concat(
-            [df[required_cols] for df in list_of_df],
+            [df.loc[~df.duplicated(subset=required_cols), required_cols] for df in list_of_df],
             ignore_index=True
-        ).drop_duplicates()
+        ).drop_duplicates(ignore_index=True)
 
         # Add DoctorID
         dim_doctor['DoctorID'] = range(1, len(dim_doctor) + 1)
@@ -66,3 +68,21 @@ class DimDoctorPreprocessor:
         dim_doctor['Hub'] = np.random.choice(DimDoctorPreprocessor.HUBS, size=len(dim_doctor))
 
         return dim_doctor
+
+    @staticmethod
+    def anonymize_doctor_names(dim_doctor: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace doctor names with anonymized labels ('Doctor 01', 'Doctor 02', ...) based on DoctorID.
+
+        Parameters
+        ----------
+        dim_doctor : pd.DataFrame
+            A Doctor dimension table as returned by generate_dim_doctor.
+
+        Returns
+        -------
+        pd.DataFrame
+            The same dimension table with anonymized 'Doctor' values.
+        """
+        dim_doctor['Doctor'] = [f'Doctor {doctor_id:02d}' for doctor_id in dim_doctor['DoctorID']]
+        return dim_doctor
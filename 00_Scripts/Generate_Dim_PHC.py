@@ -16,6 +16,8 @@ class DimPHCPreprocessor:
     -------
     generate_dim_phc() -> pd.DataFrame
         Combines, cleans, and enriches PHC data into a single dimension table.
+    anonymize_phc_names(dim_phc: pd.DataFrame) -> pd.DataFrame
+        Replaces PHC names with labels derived from PHCID.
     """
 
    
@@ -47,11 +49,11 @@ class DimPHCPreprocessor:
 
         REQUIRED_COLUMNS = list(REQUIRED_COLUMNS)
         
-        # Concatenate and drop duplicates
+        # Extract distinct PHCs per source, then merge only the small key sets
         dim_phc = pd.concat(
-            [df[REQUIRED_COLUMNS] for df in list_of_df],
+            [df.loc[~df.duplicated(subset=REQUIRED_COLUMNS), REQUIRED_COLUMNS] for df in list_of_df],
             ignore_index=True
-        ).drop_duplicates()
+        ).drop_duplicates(ignore_index=True)
 
         # Add PHCID
         dim_phc['PHCID'] = range(1, len(dim_phc) + 1)
@@ -79,3 +81,21 @@ class DimPHCPreprocessor:
         dim_phc['Division'] = dim_phc['DistrictName'].map(district_to_division)
 
         return dim_phc
+
+    @staticmethod
+    def anonymize_phc_names(dim_phc: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace PHC names with anonymized labels ('PHC 01', 'PHC 02', ...) based on PHCID.
+
+        Parameters
+        ----------
+        dim_phc : pd.DataFrame
+            A PHC dimension table as returned by generate_dim_phc.
+
+        Returns
+        -------
+        pd.DataFrame
+            The same dimension table with anonymized 'PHCName' values.
+        """
+        dim_phc['PHCName'] = [f'PHC {phc_id:02d}' for phc_id in dim_phc['PHCID']]
+        return dim_phc
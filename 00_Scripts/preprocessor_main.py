@@ -57,8 +57,9 @@ if __name__ == "__main__":
     Phclogin_df = FactTableTransformer.transform_phc_login(df = Phclogin_df, dim_phc=Dim_PHC, dim_date=Dim_Date)
     Patientreg_df = FactTableTransformer.transform_patient_registration(df = Patientreg_df, dim_phc=Dim_PHC, dim_date=Dim_Date)
 
-    Dim_Doctor['Doctor'] = 'Doctor' + " " +Dim_Doctor['DoctorID'].astype(str).str.zfill(2)
-    Dim_PHC['PHCName'] = 'PHC' + " " +Dim_PHC['PHCID'].astype(str).str.zfill(2)
+    # Anonymizing names on the dimension tables (after fact tables are keyed)
+    Dim_Doctor = DimDoctorPreprocessor.anonymize_doctor_names(Dim_Doctor)
+    Dim_PHC = DimPHCPreprocessor.anonymize_phc_names(Dim_PHC)
 
     #Save Preprocessed Data
     Appointment_df.to_parquet(os.path.join(os.getcwd(), r'../01_DataSources/Processed\Processed_Appointment.parquet'), engine="pyarrow", index=False)